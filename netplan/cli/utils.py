@@ -38,6 +38,11 @@ class _GError(ctypes.Structure):
 
 lib = ctypes.CDLL(ctypes.util.find_library('netplan'))
 lib.netplan_parse_yaml.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.POINTER(_GError))]
+lib.netplan_parse_yaml.restype = ctypes.c_int
+lib.netplan_finish_parse.argtypes = [ctypes.POINTER(ctypes.POINTER(_GError))]
+lib.netplan_finish_parse.restype = ctypes.c_void_p
+lib.netplan_clear_netdefs.argtypes = []
+lib.netplan_clear_netdefs.restype = ctypes.c_uint
 
 
 def netplan_parse(path):
@@ -20,6 +20,8 @@ import tempfile
 import unittest
 import time
 
+from unittest.mock import patch
+
 rootdir = os.path.dirname(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__))))
 exe_cli = [os.path.join(rootdir, 'src', 'netplan.script')]
@@ -90,6 +92,11 @@ fi
 class TestNetplanDBus(unittest.TestCase):
 
     def setUp(self):
+        # Restore os.environ after each test, as the mock bus and snap
+        # environment are set up by modifying it
+        env_patcher = patch.dict(os.environ)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
         self.tmp = tempfile.mkdtemp()
         os.makedirs(os.path.join(self.tmp, "etc", "netplan"), 0o700)
         os.makedirs(os.path.join(self.tmp, "lib", "netplan"), 0o700)
@@ -22,7 +22,6 @@ import sys
 import unittest
 import tempfile
 import io
-import shutil
 
 from contextlib import redirect_stdout
 from netplan.cli.core import Netplan
@@ -49,9 +48,7 @@ class TestSet(unittest.TestCase):
         self.file = '70-netplan-set.yaml'
         self.path = os.path.join(self.workdir.name, 'etc', 'netplan', self.file)
         os.makedirs(os.path.join(self.workdir.name, 'etc', 'netplan'))
-
-    def tearDown(self):
-        shutil.rmtree(self.workdir.name)
+        self.addCleanup(self.workdir.cleanup)
 
     def _set(self, args):
         args.insert(0, 'set')
@@ -234,6 +231,7 @@ class TestGet(unittest.TestCase):
         self.file = '00-config.yaml'
         self.path = os.path.join(self.workdir.name, 'etc', 'netplan', self.file)
         os.makedirs(os.path.join(self.workdir.name, 'etc', 'netplan'))
+        self.addCleanup(self.workdir.cleanup)
 
     def _get(self, args):
         args.insert(0, 'get')